@@ -1,11 +1,23 @@
+import logging
+
 import dbus
 from bluetooth_for_linux import bluetooth_constants, bluetooth_exceptions
 
+logger = logging.getLogger(__name__)
+
 
 class Advertisement(dbus.service.Object):
     PATH_BASE = '/org/bluez/ldsg/advertisement'
 
+    # Attributes that make up the advertised properties, assigning any of
+    # them invalidates the cached properties.
+    PROPERTY_ATTRIBUTES = frozenset((
+        'ad_type', 'service_uuids', 'manufacturer_data', 'solicit_uuids',
+        'service_data', 'local_name', 'include_tx_power', 'data',
+        'discoverable'))
+
     def __init__(self, bus, index, advertising_type, device_name):
+        self._cached_properties = None
         self.path = self.PATH_BASE + str(index)
         self.bus = bus
         self.ad_type = advertising_type
@@ -18,8 +30,18 @@ class Advertisement(dbus.service.Object):
         self.data = None
         self.discoverable = True
         dbus.service.Object.__init__(self, bus, self.path)
+        # Not "_object_path", which is used by "dbus.service.Object"
+        self._dbus_object_path = dbus.ObjectPath(self.path)
+
+    def __setattr__(self, name, value):
+        if name in self.PROPERTY_ATTRIBUTES:
+            object.__setattr__(self, '_cached_properties', None)
+        object.__setattr__(self, name, value)
 
     def get_properties(self):
+        if self._cached_properties is not None:
+            return self._cached_properties
+
         properties = dict()
 
         properties['Type'] = self.ad_type
@@ -43,12 +65,15 @@ class Advertisement(dbus.service.Object):
             properties['Includes'] = dbus.Array(["tx-power"], signature='s')
         if self.data is not None:
             properties['Data'] = dbus.Dictionary(self.data, signature='yv')
-        # print(properties)
-        return {bluetooth_constants.ADVERTISING_MANAGER_INTERFACE: properties}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('%r', properties)
+        self._cached_properties = \
+            {bluetooth_constants.ADVERTISING_MANAGER_INTERFACE: properties}
+        return self._cached_properties
 
     def get_path(self, adv_id=0):
         if not adv_id > 0:
-            return dbus.ObjectPath(self.path)
+            return self._dbus_object_path
         else:
             return dbus.ObjectPath(self.PATH_BASE + str(adv_id))
 
@@ -12,7 +12,31 @@ def byte_array_to_hex_string(bytes_to_convert):
     return hex_string
 
 
+# Conversions for the exact DBus types, subclasses fall back to isinstance
+DBUS_TO_PYTHON_TYPES = {
+    dbus.String: str,
+    dbus.ObjectPath: str,
+    dbus.Boolean: bool,
+    dbus.Int64: int,
+    dbus.Int32: int,
+    dbus.Int16: int,
+    dbus.UInt16: int,
+    dbus.Byte: int,
+    dbus.ByteArray: bytes,
+    dbus.Double: float,
+}
+
+
 def dbus_to_python(data):
+    data_type = type(data)
+    convert = DBUS_TO_PYTHON_TYPES.get(data_type)
+    if convert is not None:
+        return convert(data)
+    if data_type is dbus.Dictionary:
+        return {key: dbus_to_python(value) for key, value in data.items()}
+    if data_type is dbus.Array:
+        return [dbus_to_python(value) for value in data]
+
     if isinstance(data, dbus.String):
         data = str(data)
     if isinstance(data, dbus.ObjectPath):
@@ -1,20 +1,24 @@
-import os
+import argparse
+import csv
 import sys
 import re
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, \
+    Tuple
 
 # ------ [ Constants ] --------------------------------------------------------
 
 RE_TIMED_MESSAGE: str = r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - "
-RE_BT_ADDR: str = r"[A-F\d]{2}:[A-F\d]{2}:[A-F\d]{2}:[A-F\d]{2}:[A-F\d]{2}:" \
-                  r"[A-F\d]{2}"
+RE_BT_ADDR: str = r"(?:[A-F0-9]{2}:){5}[A-F0-9]{2}"
 
-RE_CONNECTION_MONITOR_START: str = RE_TIMED_MESSAGE + \
-                                   r"Connected to device\(s\)! Begin " \
-                                   r"monitoring\.\.$"
-RE_CONNECTION_MONITOR_END: str = RE_TIMED_MESSAGE + \
-                                 r"No connected devices\.\.\. Going back to " \
-                                 r"automatic connection mode\.$"
+# Endings of the timed messages for connection monitor start and end, with
+# and without line break (last line in log).
+CONNECTION_MONITOR_START: Tuple[str, str] = \
+    ("Connected to device(s)! Begin monitoring..\n",
+     "Connected to device(s)! Begin monitoring..")
+CONNECTION_MONITOR_END: Tuple[str, str] = \
+    ("No connected devices... Going back to automatic connection mode.\n",
+     "No connected devices... Going back to automatic connection mode.")
 
 RE_NODE_NAMES: str = r"[ABab]\d{1,2}"
 RE_PERSON_NAMES: str = r"[A-Za-zÅÄÖåäö]+"
@@ -23,8 +27,6 @@ RE_SECT_NAMED_FROM_TO: str = r"^//(" + RE_PERSON_NAMES + r")[:.] (" + \
                              RE_NODE_NAMES + r") to (" + RE_NODE_NAMES + r")$"
 RE_SECT_ANON_FROM_TO: str = r"^//(" + RE_NODE_NAMES + r") to (" + \
                             RE_NODE_NAMES + r")$"
-RE_SECT_ANON_FROM_TO_SHORT: str = r"^(" + RE_NODE_NAMES + r")(" + \
-                                  RE_NODE_NAMES + r")$"
 RE_SECT_NEGATIVE_FROM: str = r"^//(" + RE_PERSON_NAMES + r")[:.] (" + \
                              RE_NODE_NAMES + r") above$"
 RE_SECT_NAMED_STOP: str = r"^//(" + RE_PERSON_NAMES + r")[:.] stop$"
@@ -33,166 +35,229 @@ RE_SECT_ANON_STOP: str = r"^//stop$"
 RE_SECT_MEASUREMENT: str = RE_TIMED_MESSAGE + r"([^(]+) \((" + RE_BT_ADDR + \
                            r")\): (-?\d+) dBm"
 
+# Read buffer size for log files (1 MiB)
+LOG_FILE_BUFFER_SIZE: int = 1 << 20
+
+# All patterns are anchored at the start and used with "match", so the
+# leading "^" is stripped before compiling. Patterns are compiled as ASCII
+# ("\d" only matches [0-9]), the explicit non-ASCII letters in person names
+# are not affected by this.
+_RE_TIMED_MESSAGE: re.Pattern = re.compile(RE_TIMED_MESSAGE[1:], re.ASCII)
+
+# Section headers, in order of precedence, along with the capture groups
+# (relative to the header) holding the "from" and "to" nodes. The short
+# anonymous syntax is parsed without regex, see
+# "_parse_sect_anon_from_to_short".
+_SECT_HEADERS: Tuple[Tuple[str, str, Optional[Tuple[int, int]]], ...] = (
+    ("named_from_to", RE_SECT_NAMED_FROM_TO, (2, 3)),
+    ("anon_from_to", RE_SECT_ANON_FROM_TO, (1, 2)),
+    ("negative_from", RE_SECT_NEGATIVE_FROM, None),
+    ("named_stop", RE_SECT_NAMED_STOP, None),
+    ("anon_stop", RE_SECT_ANON_STOP, None),
+)
+
+_RE_SECT_ANY: re.Pattern = re.compile(
+    r"(?:" +
+    r"|".join(f"(?P<{name}>{pattern[1:]})"
+              for name, pattern, _ in _SECT_HEADERS) +
+    r")", re.ASCII)
+
+_SECT_NODE_GROUPS: Dict[str, Tuple[int, int]] = {
+    name: (_RE_SECT_ANY.groupindex[name] + nodes[0],
+           _RE_SECT_ANY.groupindex[name] + nodes[1])
+    for name, _, nodes in _SECT_HEADERS if nodes is not None}
+
+_RE_SECT_MEASUREMENT: re.Pattern = \
+    re.compile(RE_SECT_MEASUREMENT[1:], re.ASCII)
+
+# Characters in node names (see "RE_NODE_NAMES")
+_NODE_LETTERS: FrozenSet[str] = frozenset("ABab")
+_NODE_DIGITS: FrozenSet[str] = frozenset("0123456789")
 
-# ------ [ Helper Methods ] ---------------------------------------------------
 
+# ------ [ Log Parsing ] ------------------------------------------------------
 
-def print_program_usage() -> None:
-    """Print information about how to execute the program.
 
-    :return: Nothing
-    """
-    print("usage: python3 log_parser.py <log_file_path> "
-          "[<log_file_path2> ...]")
+def _is_timed_message(log_line: str, messages: Tuple[str, str]) -> bool:
+    """Check if a log line is a timed message (see "RE_TIMED_MESSAGE") with
+    exactly one of the provided messages after the time stamp.
 
+    :param log_line: The log line to check.
+    :param messages: The message, with and without line break.
+    :return: True if the log line is the timed message.
+    """
+    # Cheap check first, most lines don't end with the message
+    if not log_line.endswith(messages):
+        return False
 
-# ------ [ Log Parsing ] ------------------------------------------------------
+    timed_message = _RE_TIMED_MESSAGE.match(log_line)
+    return timed_message is not None and \
+        log_line[timed_message.end():] in messages
 
 
-def get_connection_monitoring_sections(
-        raw_log_lines: List[str]) -> List[List[str]]:
-    """Get the "connection monitoring" sections from the raw log
+def _parse_sect_anon_from_to_short(
+        log_line: str) -> Optional[Tuple[str, str]]:
+    """Parse a short anonymous section header, e.g. "A1B12", by hand instead
+    of by regex. The header is two node names (see "RE_NODE_NAMES") without
+    a separator, i.e. "^([ABab]\\d{1,2})([ABab]\\d{1,2})$".
 
-    :param raw_log_lines: A list of lines from the raw log.
-    :return: A list of sections from the raw log.
+    :param log_line: The log line to parse.
+    :return: The "from" and "to" nodes, or None if the line is not a short
+    anonymous section header.
     """
-    monitoring_sections = []
+    line_end = len(log_line)
+    if log_line.endswith("\n"):
+        line_end -= 1
 
-    current_section_open = False
-    current_monitoring_section = []
+    # Two nodes of one letter and one or two digits each
+    if line_end > 6:
+        return None
 
-    for log_line in raw_log_lines:
-        if re.search(RE_CONNECTION_MONITOR_START, log_line):
-            current_section_open = True
-        elif re.search(RE_CONNECTION_MONITOR_END, log_line):
-            if not current_section_open:
-                continue
+    nodes = []
+    index = 0
+    for _ in range(2):
+        if index >= line_end or log_line[index] not in _NODE_LETTERS:
+            return None
 
-            monitoring_sections.append(current_monitoring_section.copy())
-            current_section_open = False
-            current_monitoring_section = []
+        node_start = index
+        index += 1
+        while index < line_end and index - node_start < 3 and \
+                log_line[index] in _NODE_DIGITS:
+            index += 1
 
-        elif current_section_open:
-            current_monitoring_section.append(log_line)
+        if index - node_start < 2:
+            return None
 
-    if current_section_open:
-        monitoring_sections.append(current_monitoring_section.copy())
+        nodes.append(log_line[node_start:index])
 
-    return monitoring_sections
+    if index != line_end:
+        return None
+
+    return nodes[0], nodes[1]
 
 
 def get_connection_monitoring_measurements(
-        monitoring_sections: List[List[str]]) -> \
-        List[Tuple[str, str, str, str, str]]:
-    """Get all measurements from the "connection monitoring" sections as
-    a list of tuples.
+        raw_log_lines: Iterable[str]) -> \
+        Iterator[Tuple[str, str, str, str, str]]:
+    """Get all measurements from the "connection monitoring" sections of the
+    raw log as tuples. The log is read in a single pass.
 
-    :param monitoring_sections: The raw "connection monitoring" sections.
-    :return: The measurements for each section as a list of tuples.
+    :param raw_log_lines: The lines from the raw log.
+    :return: A generator of the measurements for each section as tuples.
     """
+    monitoring_open = False
+    # Set and cleared together
+    current_from = current_to = None
 
-    measurements = []
-    current_section = None, None
-
-    for section_num, log_section in enumerate(monitoring_sections):
-
-        for log_line in log_section:
-            sect_named_from_to = \
-                re.search(RE_SECT_NAMED_FROM_TO, log_line)
-            sect_anonymous_from_to = \
-                re.search(RE_SECT_ANON_FROM_TO, log_line)
-            sect_anonymous_from_to_short = \
-                re.search(RE_SECT_ANON_FROM_TO_SHORT, log_line)
-            sect_named_define_negative = \
-                re.search(RE_SECT_NEGATIVE_FROM, log_line)
-
-            sect_named_stop = \
-                re.search(RE_SECT_NAMED_STOP, log_line)
-            sect_anonymous_stop = \
-                re.search(RE_SECT_ANON_STOP, log_line)
-
-            if sect_named_from_to:
-                current_section = \
-                    sect_named_from_to.group(2), \
-                    sect_named_from_to.group(3)
-
-            elif sect_anonymous_from_to:
-                current_section = \
-                    sect_anonymous_from_to.group(1), \
-                    sect_anonymous_from_to.group(2)
-
-            elif sect_anonymous_from_to_short:
-                current_section = \
-                    sect_anonymous_from_to_short.group(1), \
-                    sect_anonymous_from_to_short.group(2)
-
-            elif sect_named_define_negative:
+    for log_line in raw_log_lines:
+        if _is_timed_message(log_line, CONNECTION_MONITOR_START):
+            monitoring_open = True
+            continue
+
+        if not monitoring_open:
+            continue
+
+        if _is_timed_message(log_line, CONNECTION_MONITOR_END):
+            monitoring_open = False
+            continue
+
+        if log_line[:1] in _NODE_LETTERS:
+            # Only the short anonymous section header starts with a node
+            sect_nodes = _parse_sect_anon_from_to_short(log_line)
+            if sect_nodes is not None:
+                current_from = sys.intern(sect_nodes[0])
+                current_to = sys.intern(sect_nodes[1])
+            continue
+
+        # All other section headers start with "//", measurements don't
+        sect_header = None
+        if log_line.startswith("//"):
+            sect_header = _RE_SECT_ANY.match(log_line)
+
+        if sect_header:
+            sect_header_type = sect_header.lastgroup
+
+            if sect_header_type in _SECT_NODE_GROUPS:
+                group_from, group_to = _SECT_NODE_GROUPS[sect_header_type]
+                current_from, current_to = \
+                    sect_header.group(group_from, group_to)
+                # Interned, as they are shared by all measurements in section
+                current_from = sys.intern(current_from)
+                current_to = sys.intern(current_to)
+
+            elif sect_header_type == "negative_from":
                 # Ignore, syntax doesn't contain opposite node
                 continue
 
-            elif sect_named_stop:
-                current_section = None, None
+            else:
+                current_from = current_to = None
+
+        elif current_from is not None:
+            sect_measurement = _RE_SECT_MEASUREMENT.match(log_line)
+            if sect_measurement:
+                measurement_time, _, measurement_bt_addr, measurement_dbm = \
+                    sect_measurement.groups()
+                yield (measurement_time, current_from, current_to,
+                       measurement_bt_addr, measurement_dbm)
 
-            elif sect_anonymous_stop:
-                current_section = None, None
 
-            elif current_section[0] is not None and \
-                    current_section[1] is not None:
-                sect_measurement = re.search(RE_SECT_MEASUREMENT, log_line)
-                if sect_measurement:
-                    measurement_bt_addr = sect_measurement.group(3)
-                    measurement_dbm = sect_measurement.group(4)
-                    measurements.append(
-                        (sect_measurement.group(1), current_section[0],
-                         current_section[1], measurement_bt_addr,
-                         measurement_dbm))
+def get_file_measurements(
+        file_path: str) -> List[Tuple[str, str, str, str, str]]:
+    """Get all measurements from the "connection monitoring" sections of a
+    log file.
 
-    return measurements
+    :param file_path: The path to the log file to read.
+    :return: The measurements for each section as a list of tuples.
+    """
+    with open(file_path, buffering=LOG_FILE_BUFFER_SIZE) as file:
+        return list(get_connection_monitoring_measurements(file))
 
 
 # ------ [ Main Program ] -----------------------------------------------------
 
 
-def run_parse_file(file_list: List[str]) -> None:
+def run_parse_file(file_paths: List[str]) -> None:
     """Run program to read file.
 
-    :param file_list: The list of files to read.
+    :param file_paths: The paths of the files to read ("-" for stdin).
     :return: Nothing
     """
     measurements_header = \
         ("Localtime", "From", "To", "Bluetooth Address", "dBm")
-    total_measurements = []
 
-    for file_path in file_list:
-        with open(file_path) as file:
-            file_lines = file.readlines()
-
-        monitoring_sections = get_connection_monitoring_sections(file_lines)
-        total_measurements += \
-            get_connection_monitoring_measurements(monitoring_sections)
-
-    total_measurements.insert(0, measurements_header)
+    measurements_writer = csv.writer(sys.stdout, lineterminator="\n")
+    measurements_writer.writerow(measurements_header)
+
+    if len(file_paths) > 1 and "-" not in file_paths:
+        # Files are independent, parse them in parallel (in order of output).
+        # Each worker opens its own file.
+        with ProcessPoolExecutor() as executor:
+            for file_measurements in \
+                    executor.map(get_file_measurements, file_paths):
+                measurements_writer.writerows(file_measurements)
+
+    else:
+        # Files are opened one at a time
+        for file_path in file_paths:
+            if file_path == "-":
+                measurements_writer.writerows(
+                    get_connection_monitoring_measurements(sys.stdin))
+                continue
 
-    for measurement_row in total_measurements:
-        print(f"{measurement_row[0]},{measurement_row[1]},"
-              f"{measurement_row[2]},{measurement_row[3]},"
-              f"{measurement_row[4]}")
+            with open(file_path, buffering=LOG_FILE_BUFFER_SIZE) as file:
+                measurements_writer.writerows(
+                    get_connection_monitoring_measurements(file))
 
 
 if __name__ == '__main__':
-    # Program Execution
-    if len(sys.argv) < 2:
-        print_program_usage()
-        sys.exit(1)
-
-    file_to_read = []
-    for file_arg in range(1, len(sys.argv)):
-        if not os.path.exists(sys.argv[file_arg]):
-            print(f"ArgFile '{sys.argv[file_arg]}' cannot be found.")
-            print_program_usage()
-            sys.exit(1)
-        else:
-            file_to_read.append(sys.argv[file_arg])
-
-    run_parse_file(file_to_read)
-
+    # Arguments
+    parser = argparse.ArgumentParser()
+    parser.add_argument("files", help="Log file(s) to parse", nargs='+',
+                        metavar="log_file_path", type=str)
+    args = parser.parse_args()
+
+    # Program Execution (files are opened when they are parsed)
+    try:
+        run_parse_file(args.files)
+    except OSError as e:
+        parser.error(f"can't open '{e.filename}': {e.strerror}")
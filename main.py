@@ -8,15 +8,14 @@ Developed with help from the "Bluetooth® Technology for Linux Developers"
 package found at:
 https://www.bluetooth.com/bluetooth-resources/bluetooth-for-linux/
 """
-from typing import Dict, Callable, Union
+from typing import Dict, Callable, FrozenSet, Set, Tuple, Union
+from functools import partial
 import argparse
+import logging
 import random
 import re
-import threading
-from enum import Enum, auto
-from datetime import datetime
 import time
-from threading import Thread, Lock
+from enum import IntEnum, auto
 import sys
 import signal
 
@@ -31,11 +30,16 @@ from gi.repository import GLib
 from bluetooth_for_linux import bluetooth_constants, bluetooth_utils
 from bluetooth_for_linux.bluetooth_advertisement import Advertisement
 
+logger = logging.getLogger(__name__)
+
 # ------ [ Unique Device Information ] ----------------------------------------
 
 # Machine ID
 device_id: str = "00000000"
 
+# Largest machine ID (128 bits, 32 hexadecimal characters)
+DEVICE_FULL_ID_MAX: int = (1 << 128) - 1
+
 
 def make_device_id(alternative: int = 0) -> str:
     """Make a device ID from the computer's machine ID, if unable then an
@@ -51,26 +55,33 @@ def make_device_id(alternative: int = 0) -> str:
 
     try:
         with open("/etc/machine-id") as f:
-            full_id = f.read().splitlines()[0]
-    except FileNotFoundError:
+            full_id = f.readline().strip() or full_id
+    except OSError:
         pass
 
+    full_id_int = int(full_id, 16)
+
+    if alternative == 0:
+        # Same as below, without multiplier and wrap-around
+        device_id = hex(full_id_int % DEVICE_FULL_ID_MAX)[2:10]
+        return device_id
+
     index_from = alternative % len(full_id)
     index_to = (alternative + 8) % len(full_id)
 
-    full_id_int = int(full_id, 16)
-    full_id_multiplier = 1 + int(alternative / len(full_id))
-    full_id_max = int("f" * len(full_id), 16)
+    full_id_multiplier = 1 + alternative // len(full_id)
 
     full_id_alternative = \
-        hex(int(full_id_int * full_id_multiplier) % full_id_max)[2:]
+        hex(full_id_int * full_id_multiplier % DEVICE_FULL_ID_MAX)[2:]
 
     if index_to < index_from:
-        return full_id_alternative[index_from:len(full_id)] + \
-               full_id_alternative[0:index_to]
+        device_id = full_id_alternative[index_from:len(full_id)] + \
+            full_id_alternative[0:index_to]
     else:
         device_id = full_id_alternative[index_from:index_to]
 
+    return device_id
+
 
 # Generate ID Once
 make_device_id()
@@ -88,14 +99,36 @@ devices_connect_to: int = 1
 
 # ------ [ Constants ] --------------------------------------------------------
 
+# Names of devices to look for (anchored, to be used with "match")
+RE_DEVICE_FIND: re.Pattern = \
+    re.compile(re.escape(device_find) + r"[a-f\d]{8}$")
+
+# DBus ObjectPath to the Bluetooth adapter
+ADAPTER_PATH: str = \
+    bluetooth_constants.BLUEZ_NAMESPACE + bluetooth_constants.ADAPTER_NAME
+
+# Interval (in milliseconds) for printing updated device info
+UPDATED_DEVICES_PRINT_INTERVAL: int = 200
+
+# Interval (in milliseconds) for the connection state of a device to settle
+CONNECTION_SETTLE_INTERVAL: int = 50
+
+# Delay (in seconds) before the first advertisement retry, doubled for each
+# following retry
+ADVERTISING_RETRY_DELAY: float = 0.05
 
-class NodeModes(Enum):
+# Timeout (in seconds) for DBus calls to BlueZ that are not expected to take
+# long, so that the program is not blocked for long if BlueZ stops responding
+DBUS_CALL_TIMEOUT: float = 5
+
+
+class NodeModes(IntEnum):
     NONE = auto()
     CENTRAL = auto()
     PERIPHERAL = auto()
 
 
-class ProgramStates(Enum):
+class ProgramStates(IntEnum):
     STEP_INIT = auto()
     STEP_DISCOVERY_START = auto()
     STEP_DISCOVERY_RUNNING = auto()
@@ -113,6 +146,21 @@ class ProgramStates(Enum):
     STEP_KILL_PROGRAM = auto()
 
 
+# Steps while each process is ongoing
+STEPS_DISCOVERY: FrozenSet[ProgramStates] = frozenset((
+    ProgramStates.STEP_DISCOVERY_START,
+    ProgramStates.STEP_DISCOVERY_RUNNING))
+STEPS_ADVERTISING: FrozenSet[ProgramStates] = frozenset((
+    ProgramStates.STEP_ADVERTISING_START,
+    ProgramStates.STEP_ADVERTISING_ACTIVE))
+STEPS_DISCOVER_ADVERTISE: FrozenSet[ProgramStates] = frozenset((
+    ProgramStates.STEP_DISCOVER_ADVERTISE_START,
+    ProgramStates.STEP_DISCOVER_ADVERTISE_ACTIVE))
+STEPS_CONNECTION: FrozenSet[ProgramStates] = frozenset((
+    ProgramStates.STEP_CONNECTION_START,
+    ProgramStates.STEP_CONNECTION_ACTIVE))
+
+
 # ------ [ Program State ] ----------------------------------------------------
 # Step in program process
 current_step: ProgramStates = ProgramStates.STEP_INIT
@@ -120,14 +168,19 @@ current_step: ProgramStates = ProgramStates.STEP_INIT
 # Have all known devices been seen
 seen_all_devices: bool = False
 
-# All found devices
+# All found devices (along with the properties they were found with, later
+# changes are only kept in the device info)
 devices_found: Dict[str, Dict[str, any]] = {}
 
-# Information about found devices
+# Information about found devices (along with their latest known properties)
 devices_info: Dict[str, Dict[str, any]] = {}
 
+# Names (along with addresses) to display for devices, by path
+devices_display_name: Dict[str, str] = {}
+
 # All devices already managed by BlueZ
 managed_objects_found: int = 0
+managed_objects_loaded: bool = False
 
 # Roles to other devices (central, peripheral)
 role_to_device: Dict[str, NodeModes] = {}
@@ -135,12 +188,33 @@ role_to_device: Dict[str, NodeModes] = {}
 # Connected devices
 devices_connected: Dict[str, Dict[str, any]] = {}
 
+# Devices with a pending connection request
+devices_connecting: Set[str] = set()
+
+# DBus interfaces (device, properties) to devices
+device_interfaces: Dict[str, Tuple[dbus.Interface, dbus.Interface]] = {}
+
+# Changed properties for devices, not yet printed (coalesced per interval)
+devices_updated: Dict[str, Dict[str, any]] = {}
+devices_updated_timer_id: Union[int, None] = None
+
 # State reset
 mainloop: Union[GLib.MainLoop, None] = None
 adapter_interface: Union[dbus.Interface, None] = None
+# Discovery is kept running between phases, see "adapter_discovery_start"
+adapter_discovering: bool = False
 timer_id: Union[int, None] = None
+seen_timer_id: Union[int, None] = None
+adv_timer_id: Union[int, None] = None
+discover_adv_timer_id: Union[int, None] = None
+discover_adv_connect_timer_id: Union[int, None] = None
+connection_monitor_timer_id: Union[int, None] = None
+# Pending connection state updates for devices, by path
+devices_connection_timer_ids: Dict[str, int] = {}
 adv_mgr_interface: Union[dbus.Interface, None] = None
 adv: Union[Advertisement, None] = None
+# Is the advertisement registered with BlueZ
+adv_registered: bool = False
 
 # Bus
 glob_connection_bus: Union[BusConnection, None] = None
@@ -153,62 +227,101 @@ signal_scan_update: Union[SignalMatch, None] = None
 signal_adv_add: Union[SignalMatch, None] = None
 signal_adv_update: Union[SignalMatch, None] = None
 
-# Mutexes
-mutex_role_to_device: threading.Lock = Lock()
+# Time stamp for messages, formatted at most once per second (second, stamp)
+dated_msg_stamp: Tuple[int, str] = (-1, "")
 
 
 # ------ [ Methods ] ----------------------------------------------------------
 # ------ [ Methods - Signal Handlers ] ----------------------------------------
 
 
-def handler_signal_interrupt(sig: int, frame: any) -> None:
+def handler_signal_interrupt() -> bool:
     """Handler for interrupt signals to shut down the program in a controlled
-    manner.
+    manner. Dispatched by the GLib main loop, which is then stopped so that
+    the program can run to its end.
 
-    :param sig: The signal number.
-    :param frame: The frame object (see,
-    https://docs.python.org/3/reference/datamodel.html#frame-objects,
-    https://docs.python.org/3/library/inspect.html#module-inspect)
-    :return: Nothing
+    :return: True, to keep handling interrupt signals.
     """
-    global current_step, devices_connected
+    global current_step, devices_connected, mainloop
 
     print("Killing program...")
 
-    if current_step == ProgramStates.STEP_DISCOVERY_START or \
-            current_step == ProgramStates.STEP_DISCOVERY_RUNNING:
-        discovery_stop()
+    # Set first, so that the program ends even if stopping fails
+    stopped_step = current_step
+    current_step = ProgramStates.STEP_KILL_PROGRAM
 
-    elif current_step == ProgramStates.STEP_ADVERTISING_START or \
-            current_step == ProgramStates.STEP_ADVERTISING_ACTIVE:
-        advertising_stop()
+    try:
+        if stopped_step in STEPS_DISCOVERY:
+            discovery_stop()
 
-    if len(devices_connected) > 0:
-        connection_monitor_stop()
+        elif stopped_step in STEPS_ADVERTISING:
+            advertising_stop()
 
-    current_step = ProgramStates.STEP_KILL_PROGRAM
-    sys.exit(0)
+        elif stopped_step in STEPS_DISCOVER_ADVERTISE:
+            discover_and_advertise_stop()
+
+        if len(devices_connected) > 0:
+            connection_monitor_stop()
+
+    finally:
+        if mainloop is not None:
+            mainloop.quit()
+
+        current_step = ProgramStates.STEP_KILL_PROGRAM
+    return True
+
+
+# ------ [ Methods - Program State ] ------------------------------------------
+
+
+def remove_pending_connection_updates() -> None:
+    """Remove pending connection state updates for all devices.
+
+    :return: Nothing
+    """
+    global devices_connection_timer_ids
+
+    for timer_id_connection in devices_connection_timer_ids.values():
+        GLib.source_remove(timer_id_connection)
+
+    devices_connection_timer_ids.clear()
+
+
+def is_connection_goal_reached() -> bool:
+    """Check if the number of connected devices has reached the goal.
+
+    :return: Returns True if enough devices are connected.
+    """
+    global devices_connected, devices_connect_to
+
+    return len(devices_connected) >= devices_connect_to
 
 
 # ------ [ Methods - Program Execution ] --------------------------------------
 
 
 def initialize_dbus() -> BusConnection:
-    """Initialize a DBus connection
+    """Initialize a DBus connection. The connection is private, so that it is
+    not shared with (and does not receive signals for) other users of the
+    SystemBus within the process.
 
     :return: The Dbus SystemBus connection instance used for communications
     """
     dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
-    return dbus.SystemBus()
+    return dbus.SystemBus(private=True)
 
 
 def register_signal_handlers() -> None:
     """Register handlers for the following system signals:
       - Interrupts
 
+    The signals are delivered through the GLib main loop, which wakes up
+    right away instead of waiting for the next event to return to Python.
+
     :return: Nothing
     """
-    signal.signal(signal.SIGINT, handler_signal_interrupt)
+    GLib.unix_signal_add(
+        GLib.PRIORITY_HIGH, signal.SIGINT, handler_signal_interrupt)
 
 
 def connect_to_devices(
@@ -220,25 +333,27 @@ def connect_to_devices(
     :param devices_to_connect: The devices to connect to.
     :return: Nothing
     """
-    global devices_connected
+    global devices_connected, devices_connecting, mainloop
 
+    # Connection requests are sent to all devices at once, the replies are
+    # handled by the main loop
     for path, raw_properties in devices_to_connect.items():
-        device_address = devices_found[path]["Address"]
-
-        device_proxy = \
-            bus.get_object(bluetooth_constants.BLUEZ_SERVICE_NAME,
-                           path)
-        device_interface = \
-            dbus.Interface(device_proxy,
-                           bluetooth_constants.DEVICE_INTERFACE)
+        device_address = \
+            devices_info.get(path, {}).get("Address", "??:??:??:??:??:??")
 
-        device_connected = get_device_property_value(
-            bus, path, "Connected")
+        # Known connected devices are skipped, otherwise the state is read
+        # from the cached properties (with DBus as fallback)
+        device_connected = path in devices_connected or \
+            get_device_property_value(bus, path, "Connected")
 
         if device_connected is not None and \
                 not device_connected:
             print_info_connect_to_device(path, device_address)
-            connect(device_interface)
+            device_interface, _ = get_device_interfaces(bus, path)
+            devices_connecting.add(path)
+            connect(device_interface,
+                    partial(handle_connect_reply, path),
+                    partial(handle_connect_error, path))
 
         else:
             print_info_already_connected_to_device(path, device_address)
@@ -246,6 +361,13 @@ def connect_to_devices(
         if path not in devices_connected:
             devices_connected[path] = raw_properties
 
+    # Wait for all replies by running the main loop here, unless called from
+    # the running main loop (which then handles the replies)
+    if mainloop is None or not mainloop.is_running():
+        while len(devices_connecting) > 0 and \
+                current_step != ProgramStates.STEP_KILL_PROGRAM:
+            GLib.MainContext.default().iteration(True)
+
 
 def disconnect_from_all_devices() -> None:
     """Disconnect from all connected devices.
@@ -257,18 +379,10 @@ def disconnect_from_all_devices() -> None:
     devices_connected_copy = devices_connected.copy()
     for path, raw_properties in devices_connected_copy.items():
 
-        device_address = "??:??:??:??:??:??"
-        if "Address" in devices_connected[path]:
-            device_address = devices_connected[path]["Address"]
-
-        device_proxy = \
-            glob_connection_bus.get_object(
-                bluetooth_constants.BLUEZ_SERVICE_NAME,
-                path)
+        device_address = \
+            devices_info.get(path, {}).get("Address", "??:??:??:??:??:??")
 
-        device_interface = \
-            dbus.Interface(device_proxy,
-                           bluetooth_constants.DEVICE_INTERFACE)
+        device_interface, _ = get_device_interfaces(glob_connection_bus, path)
 
         print_info_disconnect_from_device(path, device_address)
         disconnect(device_interface)
@@ -285,23 +399,21 @@ def get_device_info_name(device_pth: str) -> str:
     :return: The name of the device along with its Bluetooth address or
     "Unknown" and its Bluetooth address if the name was not found.
     """
-    found_device_name = "Unknown"
-    if "Name" in devices_found[device_pth]:
-        found_device_name = \
-            bluetooth_utils.dbus_to_python(
-                devices_found[device_pth]["Name"]) + \
-            " (" + \
-            bluetooth_utils.dbus_to_python(
-                devices_found[device_pth]["Address"]) + \
-            ")"
+    return devices_display_name.get(device_pth, "Unknown")
 
-    elif "Address" in devices_found[device_pth]:
-        found_device_name = found_device_name + " (" + \
-                            bluetooth_utils.dbus_to_python(
-                                devices_found[device_pth]["Address"]) + \
-                            ")"
 
-    return found_device_name
+def make_device_info_name(device_info: Dict[str, any]) -> str:
+    """Make the device name to display from the known device properties.
+
+    :param device_info: The latest known properties for the device.
+    :return: The name of the device along with its Bluetooth address or
+    "Unknown" and its Bluetooth address if the name was not found.
+    """
+    name = device_info.get("Name", "Unknown")
+    if "Address" not in device_info:
+        return name
+
+    return f"{name} ({device_info['Address']})"
 
 
 def print_info_dated_msg(*message: any) -> None:
@@ -310,7 +422,15 @@ def print_info_dated_msg(*message: any) -> None:
     :param message: The message(s) to print.
     :return: Nothing
     """
-    print(datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "-", *message)
+    global dated_msg_stamp
+
+    now = int(time.time())
+    stamp_second, stamp = dated_msg_stamp
+    if now != stamp_second:
+        stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        dated_msg_stamp = (now, stamp)
+
+    print(stamp, "-", *message)
 
 
 def print_info_existing_device(device_props: Dict[str, any]) -> None:
@@ -353,15 +473,28 @@ def print_info_removed_device(device_pth: str) -> None:
 
 def print_info_updated_device(
         device_pth: str, changed: Dict[str, any]) -> None:
-    """Print info for a device that was removed by BlueZ.
+    """Print debug info for a device that was updated by BlueZ.
 
     :param device_pth: The DBus ObjectPath to the device to print info for.
     :param changed: The device properties that changed.
     :return: Nothing
     """
-    print_info_dated_msg(
-        "Updated info for device:", get_device_info_name(device_pth),
-        f"({len(bluetooth_utils.dbus_to_python(changed))} change(s))")
+    logger.debug("Updated info for device: %s (%d change(s))",
+                 get_device_info_name(device_pth), len(changed))
+
+
+def print_info_updated_devices() -> None:
+    """Print info for all devices with changes not yet printed, once per
+    device.
+
+    :return: Nothing
+    """
+    global devices_updated
+
+    for path, changed in devices_updated.items():
+        print_info_updated_device(path, changed)
+
+    devices_updated.clear()
 
 
 def print_info_seen_device(device_pth: str, rssi: int) -> None:
@@ -412,6 +545,19 @@ def print_info_already_connected_to_device(
         "(", device_addr, ")")
 
 
+def print_info_connect_error(error: dbus.exceptions.DBusException) -> None:
+    """Print info for a failed connection to a device.
+
+    :param error: The DBus exception for the failed connection.
+    :return: Nothing
+    """
+    print_info_dated_msg("Failed to connect")
+    print_info_dated_msg(error.get_dbus_name())
+    print_info_dated_msg(error.get_dbus_message())
+    if "UnknownObject" in error.get_dbus_name():
+        print_info_dated_msg("Try scanning first to resolve this problem")
+
+
 def print_info_disconnect_from_device(
         device_pth: str, device_addr: str) -> None:
     """Print info for disconnecting from a device.
@@ -428,18 +574,16 @@ def print_info_disconnect_from_device(
 # ------ [ Methods - Basics ] -------------------------------------------------
 
 
-def is_device_matching(device_properties: Dict[str, any]) -> bool:
-    """Check if provided device match against the well known name.
+def is_device_matching(device_info: Dict[str, any]) -> bool:
+    """Check if the latest known properties of a device match against the
+    well known name.
 
-    :param device_properties: The DBus properties dict of the device to
-    match to.
-    :return: Returns True if the properties match against the known devices.
+    :param device_info: The latest known properties for the device.
+    :return: Returns True if the device name match against the known devices.
     """
-    global device_find
-    return "Name" in device_properties and \
-           re.search(r"^" + re.escape(device_find) + r"[a-f\d]{8}$",
-                     bluetooth_utils.dbus_to_python(
-                         device_properties["Name"]))
+    device_name_found = device_info.get("Name")
+    return device_name_found is not None and \
+        RE_DEVICE_FIND.match(device_name_found) is not None
 
 
 def get_matching_and_active_devices() -> Dict[str, Dict[str, any]]:
@@ -451,213 +595,131 @@ def get_matching_and_active_devices() -> Dict[str, Dict[str, any]]:
 
     matching_and_active_dev = {}
     for path, device_props in devices_found.items():
-        is_seen = False
-        if path in devices_info and "seen" in devices_info[path]:
-            is_seen = devices_info[path]["seen"]
-
-        if is_seen and is_device_matching(device_props):
+        # Seen state and name are both kept in the device info
+        device_info = devices_info.get(path)
+        if device_info is not None and device_info.get("seen", False) and \
+                is_device_matching(device_info):
             matching_and_active_dev[path] = device_props
 
     return matching_and_active_dev
 
 
-# ------ [ Methods - Thread ] -------------------------------------------------
-
-
-def thread_check_seen_devices(bus: BusConnection) -> None:
-    """Thread to continuously check for seen devices.
+def check_seen_devices() -> None:
+    """Check for seen devices among the found devices.
 
-    :param bus: The DBus BusConnection used for communications.
     :return: Nothing
     """
-    global current_step, seen_all_devices
-
-    while current_step != ProgramStates.STEP_KILL_PROGRAM \
-            and current_step != ProgramStates.STEP_DISCOVERY_DONE:
-        might_have_seen_all_devices = True
-        if current_step == ProgramStates.STEP_DISCOVERY_RUNNING:
-            devices_found_copy = devices_found.copy()
-            for path, raw_data in devices_found_copy.items():
-                if path not in devices_info or \
-                        "seen" not in devices_info[path]:
-                    devices_info[path] = {"seen": False}
-                elif devices_info[path]["seen"]:
-                    continue
+    global seen_all_devices
 
-                device_rssi: int = \
-                    get_device_property_value(bus, path, "RSSI")
+    might_have_seen_all_devices = True
+    for path in devices_found:
+        device_info = devices_info.setdefault(path, {})
+        if device_info.setdefault("seen", False):
+            continue
 
-                if device_rssi is not None:
-                    devices_info[path]["seen"] = True
-                    print_info_seen_device(path, device_rssi)
+        # Kept up to date by the "PropertiesChanged" signal
+        device_rssi: int = device_info.get("RSSI")
 
-                else:
-                    if devices_info[path]["seen"] is not False:
-                        devices_info[path]["seen"] = False
-                        print_info_not_seen_device(path)
+        if device_rssi is not None:
+            device_info["seen"] = True
+            print_info_seen_device(path, device_rssi)
 
-                    might_have_seen_all_devices = False
+        else:
+            if device_info["seen"] is not False:
+                device_info["seen"] = False
+                print_info_not_seen_device(path)
 
-            if might_have_seen_all_devices:
-                seen_all_devices = True
+            might_have_seen_all_devices = False
 
-        time.sleep(2)
+    if might_have_seen_all_devices:
+        seen_all_devices = True
 
 
-def thread_timeout_advertisement(timeout: int) -> None:
-    """Timeout for sending advertisements.
+def check_connected_devices() -> bool:
+    """Check for connected devices and print their RSSI. Stops the connection
+    monitoring process if no devices are connected.
 
-    :param timeout: The timeout in seconds.
-    :return: Nothing
+    :return: Returns True if there still are connected devices to monitor.
     """
-    global current_step, devices_connected, devices_connect_to
+    global current_step, managed_objects_loaded
 
-    for sleep_timer in range(timeout):
-        if len(devices_connected) >= devices_connect_to:
-            print_info_dated_msg("Reached connection goal!")
-            break
-
-        if current_step == ProgramStates.STEP_KILL_PROGRAM:
-            return
+    if len(devices_connected) == 0:
+        print_info_dated_msg("No connected devices... Going back to automatic connection mode.")
+        connection_monitor_stop()
+        current_step = ProgramStates.STEP_CONNECTION_RESTART
 
-        time.sleep(1)
+        # Devices were not tracked while monitoring, reload on restart
+        managed_objects_loaded = False
+        return False
 
-    if current_step == ProgramStates.STEP_ADVERTISING_START or \
-            current_step == ProgramStates.STEP_ADVERTISING_ACTIVE:
-        advertising_stop()
-        current_step = ProgramStates.STEP_DISCOVERY_DONE
+    for path in devices_connected:
+        # Kept up to date by the "PropertiesChanged" signal
+        device_info = devices_info.get(path, {})
+        name = get_device_info_name(path)
 
+        rssi = "-"
+        prop_rssi = device_info.get("RSSI")
+        if prop_rssi is not None:
+            rssi = prop_rssi
 
-def thread_timeout_discover_and_advertise(timeout: int) -> None:
-    """Timeout for the "discover and advertise" process.
+        print_info_dated_msg(f"{name}: {rssi} dBm")
 
-    :param timeout: The timeout in seconds.
-    :return: Nothing
-    """
-    global current_step
+    return True
 
-    for sleep_timer in range(timeout):
-        if current_step == ProgramStates.STEP_KILL_PROGRAM:
-            return
 
-        if current_step != ProgramStates.STEP_DISCOVER_ADVERTISE_START and \
-                current_step != ProgramStates.STEP_DISCOVER_ADVERTISE_ACTIVE:
-            break
+def claim_device_role(device_pth: str, role: NodeModes) -> bool:
+    """Claim a role for a device, if no role is already assigned to it. Roles
+    are only changed from the main loop, so no lock is needed.
 
-        time.sleep(1)
+    :param device_pth: The DBus ObjectPath to the device to claim.
+    :param role: The role to assign to the device.
+    :return: Returns True if the role was assigned to the device.
+    """
+    if role_to_device.get(device_pth, NodeModes.NONE) != NodeModes.NONE:
+        return False
 
-    if current_step == ProgramStates.STEP_DISCOVER_ADVERTISE_START or \
-            current_step == ProgramStates.STEP_DISCOVER_ADVERTISE_ACTIVE:
-        discover_and_advertise_stop()
-        current_step = ProgramStates.STEP_DISCOVER_ADVERTISE_DONE
+    role_to_device[device_pth] = role
+    return True
 
 
-def thread_connect_discover_and_advertise() -> None:
-    """Connect to matching devices during "discover and advertise" process.
+def release_device_role(device_pth: str) -> None:
+    """Release the role assigned to a device.
 
+    :param device_pth: The DBus ObjectPath to the device to release.
     :return: Nothing
     """
-    global current_step, glob_connection_bus, devices_found
-
-    while current_step != ProgramStates.STEP_KILL_PROGRAM and \
-            (current_step == ProgramStates.STEP_DISCOVER_ADVERTISE_START or
-             current_step == ProgramStates.STEP_DISCOVER_ADVERTISE_ACTIVE):
-        time.sleep(random.randint(5, 10))
+    role_to_device[device_pth] = NodeModes.NONE
 
-        if current_step == ProgramStates.STEP_KILL_PROGRAM:
-            return
 
-        devices_found_copy = devices_found.copy()
-        for path, raw_data in devices_found_copy.items():
-            if is_device_matching(raw_data):
-                dev_name = "Unknown"
-                if "Name" in raw_data:
-                    dev_name = \
-                        bluetooth_utils.dbus_to_python(raw_data["Name"])
-                dev_address = "??:??:??:??:??:??"
-                if "Address" in raw_data:
-                    dev_address = \
-                        bluetooth_utils.dbus_to_python(raw_data["Address"])
-
-                mutex_role_to_device.acquire()
-                if path not in role_to_device or \
-                        role_to_device[path] == NodeModes.NONE:
-                    print_info_dated_msg(f"Connect to {dev_name} ({dev_address})..")
-                    try:
-                        connect_to_devices(glob_connection_bus,
-                                           {path: raw_data})
-                        role_to_device[path] = NodeModes.CENTRAL
-
-                    except Exception as e:
-                        print_info_dated_msg("Failed to connect", e)
-                mutex_role_to_device.release()
-
-        print_info_dated_msg(
-            "Total connected devices:", len(devices_connected))
-
-        if len(devices_connected) >= devices_connect_to:
-            print_info_dated_msg("Reached device goal!")
-            discover_and_advertise_stop()
-            return
+# ------ [ Methods - DBus & BlueZ ] -------------------------------------------
 
 
-def thread_check_connected_devices(bus: BusConnection) -> None:
-    """Check for connected devices.
+def get_device_interfaces(
+        bus: BusConnection,
+        device_pth: str) -> Tuple[dbus.Interface, dbus.Interface]:
+    """Get the DBus device and properties interfaces for the selected device.
+    The interfaces are created once per device and then reused until BlueZ
+    removes the device.
 
     :param bus: The DBus BusConnection used for communications.
-    :return: Nothing
+    :param device_pth: The path to the device.
+    :return: The DBus device interface and the DBus properties interface
+    with all available device properties.
     """
-    global current_step
+    interfaces = device_interfaces.get(device_pth)
 
-    while current_step != ProgramStates.STEP_KILL_PROGRAM and \
-            current_step == ProgramStates.STEP_CONNECTION_START or \
-            current_step == ProgramStates.STEP_CONNECTION_ACTIVE:
-        devices_found_copy = devices_connected.copy()
+    if interfaces is None:
+        device_object = \
+            bus.get_object(bluetooth_constants.BLUEZ_SERVICE_NAME, device_pth)
+        device = \
+            dbus.Interface(device_object, bluetooth_constants.DEVICE_INTERFACE)
+        device_properties = \
+            dbus.Interface(device, bluetooth_constants.DBUS_PROPERTIES)
 
-        if len(devices_found_copy) == 0:
-            print_info_dated_msg("No connected devices... Going back to automatic connection mode.")
-            connection_monitor_stop()
-            current_step = ProgramStates.STEP_CONNECTION_RESTART
-            return
+        interfaces = device, device_properties
+        device_interfaces[device_pth] = interfaces
 
-        for path, raw_properties in devices_found_copy.items():
-            name = "Unknown"
-            prop_name = get_device_property_value(bus, path, "Name")
-            if "Name" in raw_properties:
-                name = \
-                    bluetooth_utils.dbus_to_python(
-                        raw_properties["Name"]) + \
-                    " (" + \
-                    bluetooth_utils.dbus_to_python(
-                        raw_properties["Address"]) + \
-                    ")"
-
-            elif prop_name is not None:
-                name = \
-                    prop_name + \
-                    " (" + \
-                    bluetooth_utils.dbus_to_python(
-                        raw_properties["Address"]) + \
-                    ")"
-
-            elif "Address" in raw_properties:
-                name = \
-                    name + " (" + \
-                    bluetooth_utils.dbus_to_python(
-                        raw_properties["Address"]) + \
-                    ")"
-
-            rssi = "-"
-            prop_rssi = get_device_property_value(bus, path, "RSSI")
-            if prop_rssi is not None:
-                rssi = prop_rssi
-
-            print_info_dated_msg(f"{name}: {rssi} dBm")
-
-        time.sleep(5)
-
-
-# ------ [ Methods - DBus & BlueZ ] -------------------------------------------
+    return interfaces
 
 
 def get_device_properties_interface(
@@ -669,44 +731,80 @@ def get_device_properties_interface(
     :return: The DBus properties interface with all available
     device properties.
     """
-    device_object = \
-        bus.get_object(bluetooth_constants.BLUEZ_SERVICE_NAME, device_pth)
-    device = \
-        dbus.Interface(device_object, bluetooth_constants.DEVICE_INTERFACE)
-    device_properties = \
-        dbus.Interface(device, bluetooth_constants.DBUS_PROPERTIES)
-
+    _, device_properties = get_device_interfaces(bus, device_pth)
     return device_properties
 
 
 def get_device_property_value(
         bus: BusConnection, device_pth: str,
         device_property_name: str) -> any:
-    """Get the provided property value for the selected device.
+    """Get the provided property value for the selected device. Values not
+    already known are read from BlueZ once and then kept in the device info.
 
     :param bus: The DBus BusConnection used for communications.
     :param device_pth: The DBus ObjectPath to the device.
     :param device_property_name: The property name to get the value for.
     :return: The value of the property if it exists, otherwise None
     """
+    device_info = devices_info.setdefault(device_pth, {})
+    if device_property_name in device_info:
+        return device_info[device_property_name]
+
     device_properties = get_device_properties_interface(bus, device_pth)
     try:
         property_value = \
             device_properties.Get(bluetooth_constants.DEVICE_INTERFACE,
-                                  device_property_name)
-        return property_value
+                                  device_property_name,
+                                  timeout=DBUS_CALL_TIMEOUT)
     except dbus.exceptions.DBusException:
         return None
 
+    property_value = bluetooth_utils.dbus_to_python(property_value)
+    device_info[device_property_name] = property_value
+    return property_value
+
+
+def update_device_info(
+        device_pth: str, changed: Dict[str, any],
+        invalidated: Union[dbus.Array, None] = None) -> None:
+    """Update the latest known properties for the selected device from
+    properties reported by BlueZ.
+
+    :param device_pth: The DBus ObjectPath to the device.
+    :param changed: The DBus properties dict with new or changed properties
+    for the device.
+    :param invalidated: The DBus array of properties that are now invalidated.
+    :return: Nothing
+    """
+    device_info = devices_info.setdefault(device_pth, {})
+    device_info.update(bluetooth_utils.dbus_to_python(changed))
+
+    name_changed = "Name" in changed or "Address" in changed
+
+    if invalidated is not None:
+        for property_name in invalidated:
+            device_info.pop(property_name, None)
+            if property_name == "Name" or property_name == "Address":
+                name_changed = True
+
+    if name_changed or device_pth not in devices_display_name:
+        devices_display_name[device_pth] = make_device_info_name(device_info)
+
 
 def find_known_devices(bus: BusConnection) -> None:
-    """Get all devices already known by BlueZ and update the found devices
-    accordingly.
+    """Get all devices known by BlueZ and update the found devices
+    accordingly. BlueZ is only asked when the found devices are not loaded,
+    i.e. at the start and after a restart (when devices may have been added
+    or removed while the "InterfacesAdded" and "InterfacesRemoved" signals
+    were not handled).
 
     :param bus: The DBus BusConnection used for communications.
     :return: Nothing
     """
-    global current_step, managed_objects_found
+    global current_step, managed_objects_found, managed_objects_loaded
+
+    if managed_objects_loaded:
+        return
 
     object_manager = \
         dbus.Interface(
@@ -714,15 +812,81 @@ def find_known_devices(bus: BusConnection) -> None:
             bluetooth_constants.DBUS_OM_IFACE)
 
     managed_objects = object_manager.GetManagedObjects()
+    managed_devices = set()
     for path, ifaces in managed_objects.items():
-        for iface_name in ifaces:
-            if iface_name == bluetooth_constants.DEVICE_INTERFACE:
-                device_properties = \
-                    ifaces[bluetooth_constants.DEVICE_INTERFACE]
+        device_properties = ifaces.get(bluetooth_constants.DEVICE_INTERFACE)
+        if device_properties is None:
+            continue
+
+        managed_devices.add(path)
+
+        if path not in devices_found:
+            print_info_existing_device(device_properties)
+            managed_objects_found += 1
+
+        devices_found[path] = device_properties
+        update_device_info(path, device_properties)
+
+    for path in list(devices_found):
+        if path not in managed_devices:
+            forget_device(path)
+
+    managed_objects_loaded = True
 
-                print_info_existing_device(device_properties)
-                managed_objects_found += 1
-                devices_found[path] = device_properties
+
+def forget_device(device_pth: str) -> None:
+    """Forget a device that BlueZ no longer knows about.
+
+    :param device_pth: The DBus ObjectPath to the device.
+    :return: Nothing
+    """
+    device_interfaces.pop(device_pth, None)
+
+    if device_pth in devices_found:
+        print_info_removed_device(device_pth)
+        del devices_found[device_pth]
+
+    devices_info.pop(device_pth, None)
+    devices_display_name.pop(device_pth, None)
+
+
+def adapter_discovery_start(bus: BusConnection) -> None:
+    """Start device discovery on the adapter, unless it is already running.
+    Discovery is kept running between the phases of the program, as starting
+    and stopping it involves commands to the controller.
+
+    :param bus: The DBus BusConnection used for communications.
+    :return: Nothing
+    """
+    global adapter_interface, adapter_discovering
+
+    if adapter_discovering:
+        return
+
+    if adapter_interface is None:
+        adapter_object = \
+            bus.get_object(
+                bluetooth_constants.BLUEZ_SERVICE_NAME, ADAPTER_PATH)
+        adapter_interface = \
+            dbus.Interface(
+                adapter_object, bluetooth_constants.ADAPTER_INTERFACE)
+
+    adapter_interface.StartDiscovery(byte_arrays=True,
+                                     timeout=DBUS_CALL_TIMEOUT)
+    adapter_discovering = True
+
+
+def adapter_discovery_stop() -> None:
+    """Stop device discovery on the adapter, if it is running.
+
+    :return: Nothing
+    """
+    global adapter_interface, adapter_discovering
+
+    if adapter_interface is not None and adapter_discovering:
+        adapter_interface.StopDiscovery(timeout=DBUS_CALL_TIMEOUT)
+
+    adapter_discovering = False
 
 
 def discovery_start(bus: BusConnection, timeout: int) -> None:
@@ -732,32 +896,33 @@ def discovery_start(bus: BusConnection, timeout: int) -> None:
     :param timeout: Timeout for discovery process.
     :return: Nothing
     """
-    global current_step, adapter_interface, mainloop, timer_id, \
+    global current_step, mainloop, timer_id, seen_timer_id, \
         signal_scan_add, signal_scan_remove, signal_scan_update
     current_step = ProgramStates.STEP_DISCOVERY_START
 
-    adapter_path = \
-        bluetooth_constants.BLUEZ_NAMESPACE + bluetooth_constants.ADAPTER_NAME
-    adapter_object = \
-        bus.get_object(bluetooth_constants.BLUEZ_SERVICE_NAME, adapter_path)
-    adapter_interface = \
-        dbus.Interface(adapter_object, bluetooth_constants.ADAPTER_INTERFACE)
-
+    # Only signals from BlueZ (and for devices) are delivered
     signal_scan_add = bus.add_signal_receiver(
         handle_interface_added,
         dbus_interface=bluetooth_constants.DBUS_OM_IFACE,
-        signal_name="InterfacesAdded")
+        signal_name="InterfacesAdded",
+        bus_name=bluetooth_constants.BLUEZ_SERVICE_NAME,
+        byte_arrays=True)
 
     signal_scan_remove = bus.add_signal_receiver(
         handle_interface_removed,
         dbus_interface=bluetooth_constants.DBUS_OM_IFACE,
-        signal_name="InterfacesRemoved")
+        signal_name="InterfacesRemoved",
+        bus_name=bluetooth_constants.BLUEZ_SERVICE_NAME,
+        byte_arrays=True)
 
     signal_scan_update = bus.add_signal_receiver(
         handle_properties_changed,
         dbus_interface=bluetooth_constants.DBUS_PROPERTIES,
         signal_name="PropertiesChanged",
-        path_keyword="path")
+        path_keyword="path",
+        bus_name=bluetooth_constants.BLUEZ_SERVICE_NAME,
+        arg0=bluetooth_constants.DEVICE_INTERFACE,
+        byte_arrays=True)
 
     mainloop = GLib.MainLoop()
 
@@ -765,8 +930,10 @@ def discovery_start(bus: BusConnection, timeout: int) -> None:
         timeout = 30
 
     timer_id = GLib.timeout_add(timeout, discovery_stop)
+    seen_timer_id = \
+        GLib.timeout_add_seconds(2, handle_check_seen_devices_timeout)
 
-    adapter_interface.StartDiscovery(byte_arrays=True)
+    adapter_discovery_start(bus)
     current_step = ProgramStates.STEP_DISCOVERY_RUNNING
     mainloop.run()
 
@@ -776,18 +943,20 @@ def discovery_stop() -> None:
 
     :return: Nothing
     """
-    global current_step, adapter_interface, mainloop, timer_id, \
-        signal_scan_add, signal_scan_remove, signal_scan_update
+    global current_step, mainloop, timer_id, seen_timer_id, \
+        signal_scan_add, signal_scan_remove, signal_scan_update, \
+        devices_updated_timer_id
 
     if timer_id is not None:
         GLib.source_remove(timer_id)
 
+    if seen_timer_id is not None:
+        GLib.source_remove(seen_timer_id)
+        seen_timer_id = None
+
     if mainloop is not None:
         mainloop.quit()
 
-    if adapter_interface is not None:
-        adapter_interface.StopDiscovery()
-
     if signal_scan_add is not None:
         signal_scan_add.remove()
 
@@ -797,23 +966,37 @@ def discovery_stop() -> None:
     if signal_scan_update is not None:
         signal_scan_update.remove()
 
+    if devices_updated_timer_id is not None:
+        GLib.source_remove(devices_updated_timer_id)
+        devices_updated_timer_id = None
+    print_info_updated_devices()
+
     current_step = ProgramStates.STEP_DISCOVERY_DONE
 
 
-def connect(device_inf: dbus.Interface) -> int:
-    """Connect to the device using its device path.
+def connect(
+        device_inf: dbus.Interface,
+        reply_handler: Union[Callable[[], None], None] = None,
+        error_handler: Union[Callable[[Exception], None], None] = None) \
+        -> int:
+    """Connect to the device using its device path. If handlers are provided
+    the connection is made asynchronously, with the result passed to the
+    handlers by the main loop.
 
     :param device_inf: The DBus interfaces for the device.
+    :param reply_handler: Handler for when the device was connected.
+    :param error_handler: Handler for when the connection failed.
     :return: Status code
     """
+    if reply_handler is not None and error_handler is not None:
+        device_inf.Connect(
+            reply_handler=reply_handler, error_handler=error_handler)
+        return bluetooth_constants.RESULT_OK
+
     try:
         device_inf.Connect()
     except dbus.exceptions.DBusException as e:
-        print_info_dated_msg("Failed to connect")
-        print_info_dated_msg(e.get_dbus_name())
-        print_info_dated_msg(e.get_dbus_message())
-        if "UnknownObject" in e.get_dbus_name():
-            print_info_dated_msg("Try scanning first to resolve this problem")
+        print_info_connect_error(e)
         return bluetooth_constants.RESULT_EXCEPTION
     else:
         print_info_dated_msg("Connected OK")
@@ -851,13 +1034,10 @@ def advertising_setup(bus: BusConnection) -> None:
         print_info_dated_msg("Restart: Advertisement")
     else:
         print_info_dated_msg("Start: Advertisement")
-        adapter_path = \
-            bluetooth_constants.BLUEZ_NAMESPACE + \
-            bluetooth_constants.ADAPTER_NAME
         adv_mgr_interface = \
             dbus.Interface(
                 bus.get_object(
-                    bluetooth_constants.BLUEZ_SERVICE_NAME, adapter_path),
+                    bluetooth_constants.BLUEZ_SERVICE_NAME, ADAPTER_PATH),
                 bluetooth_constants.ADVERTISING_MANAGER_INTERFACE)
         adv = Advertisement(bus, 0, 'peripheral', device_name)
 
@@ -884,7 +1064,8 @@ def advertising_initiate(
     advertising.
     :return:
     """
-    global signal_adv_add, signal_adv_update, adv_mgr_interface, adv
+    global signal_adv_add, signal_adv_update, adv_mgr_interface, adv, \
+        adv_registered
 
     if adv_mgr_interface is None:
         raise Exception("'adv_mgr_interface' must be initiated!")
@@ -892,35 +1073,35 @@ def advertising_initiate(
     if adv is None:
         raise Exception("'adv' must be initiated!")
 
+    # Added once, retries would otherwise leave stale receivers behind
+    signal_adv_add = bus.add_signal_receiver(
+        callback_added,
+        dbus_interface=bluetooth_constants.DBUS_OM_IFACE,
+        signal_name="InterfacesAdded",
+        bus_name=bluetooth_constants.BLUEZ_SERVICE_NAME,
+        byte_arrays=True)
+
+    signal_adv_update = bus.add_signal_receiver(
+        callback_updated,
+        dbus_interface=bluetooth_constants.DBUS_PROPERTIES,
+        signal_name="PropertiesChanged", path_keyword="path",
+        bus_name=bluetooth_constants.BLUEZ_SERVICE_NAME,
+        arg0=bluetooth_constants.DEVICE_INTERFACE,
+        byte_arrays=True)
+
+    # Only the provided callbacks are passed on
+    register_kwargs = {}
+    if callback_adv_reply is not None:
+        register_kwargs["reply_handler"] = callback_adv_reply
+    if callback_adv_error is not None:
+        register_kwargs["error_handler"] = callback_adv_error
+
     for tries in range(5):
         print_info_dated_msg("Advertisement initiate: Trial #" + str(tries + 1) + ".")
         try:
-            signal_adv_add = bus.add_signal_receiver(
-                callback_added,
-                dbus_interface=bluetooth_constants.DBUS_OM_IFACE,
-                signal_name="InterfacesAdded")
-
-            signal_adv_update = bus.add_signal_receiver(
-                callback_updated,
-                dbus_interface=bluetooth_constants.DBUS_PROPERTIES,
-                signal_name="PropertiesChanged", path_keyword="path")
-
-            if callback_adv_reply is None and callback_adv_error is None:
-                adv_mgr_interface.RegisterAdvertisement(adv.get_path(), {})
-            elif callback_adv_reply is not None and callback_adv_error is None:
-                adv_mgr_interface.RegisterAdvertisement(
-                    adv.get_path(), {},
-                    reply_handler=callback_adv_reply)
-            elif callback_adv_reply is None and callback_adv_error is not None:
-                adv_mgr_interface.RegisterAdvertisement(
-                    adv.get_path(), {},
-                    error_handler=callback_adv_error)
-            elif callback_adv_reply is not None \
-                    and callback_adv_error is not None:
-                adv_mgr_interface.RegisterAdvertisement(
-                    adv.get_path(), {},
-                    reply_handler=callback_adv_reply,
-                    error_handler=callback_adv_error)
+            adv_mgr_interface.RegisterAdvertisement(
+                adv.get_path(), {}, timeout=DBUS_CALL_TIMEOUT,
+                **register_kwargs)
 
         except dbus.exceptions.DBusException as e:
             if e.get_dbus_name() == "org.bluez.Error.AlreadyExists":
@@ -932,12 +1113,37 @@ def advertising_initiate(
                 if tries >= 4:
                     print_info_dated_msg("Failed to advertise!")
                     sys.exit(1)
+
+                # Give BlueZ time to release its state before retrying
+                time.sleep(ADVERTISING_RETRY_DELAY * (1 << tries))
         else:
             break
 
+    adv_registered = True
     print_info_dated_msg("Advertisement initiated!")
 
 
+def advertising_unregister() -> None:
+    """Unregister the advertisement, if it is registered. Safe to call more
+    than once, e.g. when several processes are stopped.
+
+    :return: Nothing
+    """
+    global adv_mgr_interface, adv, adv_registered
+
+    if not adv_registered or adv_mgr_interface is None or adv is None:
+        return
+
+    adv_registered = False
+    try:
+        adv_mgr_interface.UnregisterAdvertisement(
+            adv.get_path(), timeout=DBUS_CALL_TIMEOUT)
+    except dbus.exceptions.DBusException as e:
+        print_info_dated_msg("Advertisement unregister: Failed!")
+        print_info_dated_msg("-", e.get_dbus_name())
+        print_info_dated_msg("-", e.get_dbus_message())
+
+
 def advertising_start(bus: BusConnection, timeout: int) -> None:
     """Start device advertisement to become connectable.
 
@@ -946,7 +1152,7 @@ def advertising_start(bus: BusConnection, timeout: int) -> None:
     :return: Nothing
     """
     global current_step, adv_mgr_interface, adv, mainloop, signal_adv_add, \
-        signal_adv_update, glob_connection_bus
+        signal_adv_update, glob_connection_bus, adv_timer_id
     current_step = ProgramStates.STEP_ADVERTISING_START
 
     glob_connection_bus = bus
@@ -962,11 +1168,9 @@ def advertising_start(bus: BusConnection, timeout: int) -> None:
     if not timeout > 0:
         timeout = 30
 
-    thread = Thread(target=thread_timeout_advertisement, args=(timeout,))
-    thread.start()
+    adv_timer_id = GLib.timeout_add_seconds(timeout, advertising_finish)
     current_step = ProgramStates.STEP_ADVERTISING_ACTIVE
     mainloop.run()
-    thread.join()
 
 
 def advertising_stop() -> None:
@@ -975,23 +1179,47 @@ def advertising_stop() -> None:
     :return: Nothing
     """
     global current_step, adv, adv_mgr_interface, mainloop, signal_adv_add, \
-        signal_adv_update
+        signal_adv_update, adv_timer_id
+
+    if adv_timer_id is not None:
+        GLib.source_remove(adv_timer_id)
+        adv_timer_id = None
 
     if mainloop is not None:
         mainloop.quit()
 
-    if adv_mgr_interface is not None and adv is not None:
-        adv_mgr_interface.UnregisterAdvertisement(adv.get_path())
+    advertising_unregister()
 
     if signal_adv_add is not None:
         signal_adv_add.remove()
+        signal_adv_add = None
 
     if signal_adv_update is not None:
         signal_adv_update.remove()
+        signal_adv_update = None
 
     current_step = ProgramStates.STEP_ADVERTISING_DONE
 
 
+def advertising_finish() -> bool:
+    """Finish the advertising process, when it has timed out or the
+    connection goal has been reached.
+
+    :return: False, to only run once as a timeout.
+    """
+    global current_step
+
+    if is_connection_goal_reached():
+        print_info_dated_msg("Reached connection goal!")
+
+    # Also removes the timeout, if still pending
+    if current_step in STEPS_ADVERTISING:
+        advertising_stop()
+        current_step = ProgramStates.STEP_DISCOVERY_DONE
+
+    return False
+
+
 def discover_and_advertise_start(bus: BusConnection, timeout: int) -> None:
     """Start the "discovery and advertising" process.
 
@@ -999,45 +1227,41 @@ def discover_and_advertise_start(bus: BusConnection, timeout: int) -> None:
     :param timeout: Timeout in seconds.
     :return: Nothing
     """
-    global current_step, mainloop, adapter_interface, adv_mgr_interface, adv, \
+    global current_step, mainloop, adv_mgr_interface, adv, \
         glob_connection_bus, signal_scan_add, signal_scan_remove, \
-        signal_scan_update, device_name
+        signal_scan_update, device_name, discover_adv_timer_id, \
+        discover_adv_connect_timer_id
     current_step = ProgramStates.STEP_DISCOVER_ADVERTISE_START
 
-    # General Setup
-    adapter_path = \
-        bluetooth_constants.BLUEZ_NAMESPACE + \
-        bluetooth_constants.ADAPTER_NAME
-
-    # Discovery Setup
-    adapter_object = \
-        bus.get_object(
-            bluetooth_constants.BLUEZ_SERVICE_NAME, adapter_path)
-    adapter_interface = \
-        dbus.Interface(
-            adapter_object, bluetooth_constants.ADAPTER_INTERFACE)
-
     # Advertise Setup
     advertising_setup(bus)
 
     # Discovery Start
-    adapter_interface.StartDiscovery(byte_arrays=True)
+    adapter_discovery_start(bus)
 
+    # Only signals from BlueZ (and for devices) are delivered
     signal_scan_add = bus.add_signal_receiver(
         handle_interface_added,
         dbus_interface=bluetooth_constants.DBUS_OM_IFACE,
-        signal_name="InterfacesAdded")
+        signal_name="InterfacesAdded",
+        bus_name=bluetooth_constants.BLUEZ_SERVICE_NAME,
+        byte_arrays=True)
 
     signal_scan_remove = bus.add_signal_receiver(
         handle_interface_removed,
         dbus_interface=bluetooth_constants.DBUS_OM_IFACE,
-        signal_name="InterfacesRemoved")
+        signal_name="InterfacesRemoved",
+        bus_name=bluetooth_constants.BLUEZ_SERVICE_NAME,
+        byte_arrays=True)
 
     signal_scan_update = bus.add_signal_receiver(
         handle_properties_changed,
         dbus_interface=bluetooth_constants.DBUS_PROPERTIES,
         signal_name="PropertiesChanged",
-        path_keyword="path")
+        path_keyword="path",
+        bus_name=bluetooth_constants.BLUEZ_SERVICE_NAME,
+        arg0=bluetooth_constants.DEVICE_INTERFACE,
+        byte_arrays=True)
 
     # Advertisement Start
     advertising_initiate(bus, handle_connection_monitor_interfaces_added,
@@ -1052,19 +1276,13 @@ def discover_and_advertise_start(bus: BusConnection, timeout: int) -> None:
     if not timeout > 0:
         timeout = 30
 
-    thread_timeout = Thread(
-        target=thread_timeout_discover_and_advertise,
-        args=(timeout,))
-
-    thread_connect = Thread(
-        target=thread_connect_discover_and_advertise)
+    discover_adv_timer_id = \
+        GLib.timeout_add_seconds(timeout, discover_and_advertise_finish)
+    discover_adv_connect_timer_id = GLib.timeout_add_seconds(
+        random.randint(5, 10), handle_discover_and_advertise_connect_timeout)
 
-    thread_timeout.start()
-    thread_connect.start()
     current_step = ProgramStates.STEP_DISCOVER_ADVERTISE_ACTIVE
     mainloop.run()
-    thread_timeout.join()
-    thread_connect.join()
 
 
 def discover_and_advertise_stop() -> None:
@@ -1072,16 +1290,25 @@ def discover_and_advertise_stop() -> None:
 
     :return: Nothing
     """
-    global current_step, mainloop, adapter_interface, adv_mgr_interface, adv, \
-        signal_scan_add, signal_scan_remove, signal_scan_update
+    global current_step, mainloop, adv_mgr_interface, adv, \
+        signal_scan_add, signal_scan_remove, signal_scan_update, \
+        signal_adv_add, signal_adv_update, discover_adv_timer_id, \
+        discover_adv_connect_timer_id
+
+    if discover_adv_timer_id is not None:
+        GLib.source_remove(discover_adv_timer_id)
+        discover_adv_timer_id = None
+
+    if discover_adv_connect_timer_id is not None:
+        GLib.source_remove(discover_adv_connect_timer_id)
+        discover_adv_connect_timer_id = None
+
+    remove_pending_connection_updates()
 
     if mainloop is not None:
         mainloop.quit()
 
-    # Discovery Stop
-    if adapter_interface is not None:
-        adapter_interface.StopDiscovery()
-
+    # Discovery Stop (discovery itself is kept running)
     if signal_scan_add is not None:
         signal_scan_add.remove()
 
@@ -1092,12 +1319,77 @@ def discover_and_advertise_stop() -> None:
         signal_scan_update.remove()
 
     # Advertise Stop
-    if adv_mgr_interface is not None and adv is not None:
-        adv_mgr_interface.UnregisterAdvertisement(adv.get_path())
+    advertising_unregister()
+
+    if signal_adv_add is not None:
+        signal_adv_add.remove()
+        signal_adv_add = None
+
+    if signal_adv_update is not None:
+        signal_adv_update.remove()
+        signal_adv_update = None
 
     current_step = ProgramStates.STEP_DISCOVER_ADVERTISE_DONE
 
 
+def discover_and_advertise_finish() -> bool:
+    """Finish the "discovery and advertising" process, when it has timed out.
+
+    :return: False, to only run once as a timeout.
+    """
+    global current_step
+
+    # Also removes the timeout
+    if current_step in STEPS_DISCOVER_ADVERTISE:
+        discover_and_advertise_stop()
+
+    return False
+
+
+def discover_and_advertise_connect() -> None:
+    """Connect to matching devices during "discover and advertise" process.
+
+    :return: Nothing
+    """
+    global glob_connection_bus, devices_found
+
+    # Not changed while connecting, signals are handled by the same main loop
+    for path, raw_data in devices_found.items():
+        if is_connection_goal_reached():
+            break
+
+        device_info = devices_info.get(path, {})
+        if is_device_matching(device_info):
+            dev_name = device_info.get("Name", "Unknown")
+            dev_address = device_info.get("Address", "??:??:??:??:??:??")
+
+            if claim_device_role(path, NodeModes.CENTRAL):
+                print_info_dated_msg(f"Connect to {dev_name} ({dev_address})..")
+                try:
+                    connect_to_devices(glob_connection_bus, {path: raw_data})
+
+                except Exception as e:
+                    print_info_dated_msg("Failed to connect", e)
+                    release_device_role(path)
+
+    print_info_dated_msg(
+        "Total connected devices:", len(devices_connected))
+
+
+def discover_and_advertise_check_goal() -> None:
+    """Stop the "discovery and advertising" process if the connection goal has
+    been reached and no connection requests are pending.
+
+    :return: Nothing
+    """
+    global current_step
+
+    if current_step in STEPS_DISCOVER_ADVERTISE and \
+            len(devices_connecting) == 0 and is_connection_goal_reached():
+        print_info_dated_msg("Reached device goal!")
+        discover_and_advertise_stop()
+
+
 def connection_monitor_start(
         bus: BusConnection,
         devices_conn: Union[Dict[str, Dict[str, any]], None] = None) -> None:
@@ -1107,7 +1399,13 @@ def connection_monitor_start(
     :param devices_conn: The devices to connect to
     :return: Nothing
     """
-    global current_step, mainloop, glob_connection_bus
+    global current_step, mainloop, glob_connection_bus, \
+        connection_monitor_timer_id
+
+    # Interrupted while getting ready
+    if current_step == ProgramStates.STEP_KILL_PROGRAM:
+        return
+
     current_step = ProgramStates.STEP_CONNECTION_START
 
     glob_connection_bus = bus
@@ -1116,33 +1414,24 @@ def connection_monitor_start(
         connect_to_devices(bus, devices_conn)
 
     # Scan (to get RSSI)
-    global adapter_interface
-    if adapter_interface is not None:
-        print_info_dated_msg("Restart: Discovery")
+    if adapter_discovering:
+        print_info_dated_msg("Continue: Discovery")
     else:
         print_info_dated_msg("Start: Discovery")
-        adapter_path = \
-            bluetooth_constants.BLUEZ_NAMESPACE + \
-            bluetooth_constants.ADAPTER_NAME
-        adapter_object = \
-            bus.get_object(
-                bluetooth_constants.BLUEZ_SERVICE_NAME, adapter_path)
-        adapter_interface = \
-            dbus.Interface(
-                adapter_object, bluetooth_constants.ADAPTER_INTERFACE)
 
-    adapter_interface.StartDiscovery(byte_arrays=True)
+    adapter_discovery_start(bus)
 
     # Advertise (to show RSSI):
     advertising_setup(bus)
     advertising_initiate(bus, handle_connection_monitor_interfaces_added,
                          handle_connection_monitor_properties_changed)
 
-    thread = Thread(target=thread_check_connected_devices, args=(bus,))
-    thread.start()
+    # First check as soon as the main loop runs
+    connection_monitor_timer_id = \
+        GLib.idle_add(handle_check_connected_devices_timeout)
+
     current_step = ProgramStates.STEP_CONNECTION_ACTIVE
     mainloop.run()
-    thread.join()
 
 
 def connection_monitor_stop() -> None:
@@ -1150,28 +1439,30 @@ def connection_monitor_stop() -> None:
 
     :return: Nothing
     """
-    global current_step, mainloop
+    global current_step, mainloop, connection_monitor_timer_id
+
+    if connection_monitor_timer_id is not None:
+        GLib.source_remove(connection_monitor_timer_id)
+        connection_monitor_timer_id = None
+
+    remove_pending_connection_updates()
 
     disconnect_from_all_devices()
 
     if mainloop is not None:
         mainloop.quit()
 
-    # Discover
-    global adapter_interface
-    if adapter_interface is not None:
-        adapter_interface.StopDiscovery()
-
     # Advertise
     global adv_mgr_interface, adv, signal_adv_add, signal_adv_update
-    if adv_mgr_interface is not None and adv is not None:
-        adv_mgr_interface.UnregisterAdvertisement(adv.get_path())
+    advertising_unregister()
 
     if signal_adv_add is not None:
         signal_adv_add.remove()
+        signal_adv_add = None
 
     if signal_adv_update is not None:
         signal_adv_update.remove()
+        signal_adv_update = None
 
     current_step = ProgramStates.STEP_CONNECTION_DONE
 
@@ -1190,11 +1481,12 @@ def handle_interface_added(
     """
     global current_step, devices_found, adv_mgr_interface, adv
 
-    if bluetooth_constants.DEVICE_INTERFACE not in interfaces:
+    device_properties = interfaces.get(bluetooth_constants.DEVICE_INTERFACE)
+    if device_properties is None:
         return
 
-    device_properties = interfaces[bluetooth_constants.DEVICE_INTERFACE]
     devices_found[path] = device_properties
+    update_device_info(path, device_properties)
     print_info_found_device(path)
 
 
@@ -1209,12 +1501,10 @@ def handle_interface_removed(
     """
     global current_step
 
-    if bluetooth_constants.DEVICE_INTERFACE not in interfaces or \
-            path not in devices_found:
+    if bluetooth_constants.DEVICE_INTERFACE not in interfaces:
         return
 
-    print_info_removed_device(path)
-    del devices_found[path]
+    forget_device(path)
 
 
 def handle_properties_changed(
@@ -1230,19 +1520,119 @@ def handle_properties_changed(
     :param path: The DBus ObjectPath to the device.
     :return: Nothing.
     """
-    global current_step
+    global current_step, devices_updated, devices_updated_timer_id
 
     if interface != bluetooth_constants.DEVICE_INTERFACE:
         return
 
-    print_info_updated_device(path, changed)
+    update_device_info(path, changed, invalidated)
 
-    if path in devices_found:
-        devices_found[path].update(changed)
-    else:
+    # Printed (for debugging) once per interval, as RSSI updates come in
+    # bursts
+    if logger.isEnabledFor(logging.DEBUG):
+        devices_updated.setdefault(path, {}).update(changed)
+        if devices_updated_timer_id is None:
+            devices_updated_timer_id = GLib.timeout_add(
+                UPDATED_DEVICES_PRINT_INTERVAL,
+                handle_updated_devices_timeout)
+
+    if path not in devices_found:
         devices_found[path] = changed
 
 
+def handle_check_seen_devices_timeout() -> bool:
+    """Handler for periodically checking for seen devices during discovery.
+
+    :return: True, to keep checking until the timeout is removed.
+    """
+    if current_step == ProgramStates.STEP_DISCOVERY_RUNNING:
+        check_seen_devices()
+
+    return True
+
+
+def handle_updated_devices_timeout() -> bool:
+    """Handler for when the interval for printing updated devices has passed.
+
+    :return: False, to only run the timeout once.
+    """
+    global devices_updated_timer_id
+
+    devices_updated_timer_id = None
+    print_info_updated_devices()
+    return False
+
+
+def handle_discover_and_advertise_connect_timeout() -> bool:
+    """Handler for periodically connecting to matching devices during the
+    "discover and advertise" process, with a random interval between
+    attempts.
+
+    :return: False, as the next attempt is scheduled with a new interval.
+    """
+    global current_step, discover_adv_connect_timer_id
+
+    discover_adv_connect_timer_id = None
+
+    if current_step not in STEPS_DISCOVER_ADVERTISE:
+        return False
+
+    discover_and_advertise_connect()
+    discover_and_advertise_check_goal()
+
+    if current_step in STEPS_DISCOVER_ADVERTISE:
+        discover_adv_connect_timer_id = GLib.timeout_add_seconds(
+            random.randint(5, 10),
+            handle_discover_and_advertise_connect_timeout)
+
+    return False
+
+
+def handle_check_connected_devices_timeout() -> bool:
+    """Handler for periodically checking for connected devices during the
+    connection monitoring process.
+
+    :return: False, as the next check is scheduled again if needed.
+    """
+    global current_step, connection_monitor_timer_id
+
+    connection_monitor_timer_id = None
+
+    if current_step in STEPS_CONNECTION and check_connected_devices():
+        connection_monitor_timer_id = GLib.timeout_add_seconds(
+            5, handle_check_connected_devices_timeout)
+
+    return False
+
+
+def handle_connect_reply(device_pth: str) -> None:
+    """Handler for when a device was connected.
+
+    :param device_pth: The DBus ObjectPath to the connected device.
+    :return: Nothing
+    """
+    global devices_connecting
+
+    print_info_dated_msg("Connected OK")
+    devices_connecting.discard(device_pth)
+    discover_and_advertise_check_goal()
+
+
+def handle_connect_error(
+        device_pth: str, error: dbus.exceptions.DBusException) -> None:
+    """Handler for when connecting to a device failed.
+
+    :param device_pth: The DBus ObjectPath to the device.
+    :param error: The DBus exception for the failed connection.
+    :return: Nothing
+    """
+    global devices_connecting
+
+    print_info_connect_error(error)
+    devices_connecting.discard(device_pth)
+    discover_and_advertise_check_goal()
+
+
 def handle_register_ad_cb() -> None:
     """Handle successful registration of advertisement.
 
@@ -1252,7 +1642,8 @@ def handle_register_ad_cb() -> None:
 
 
 def handle_register_ad_error_cb(error: any) -> None:
-    global mainloop
+    global mainloop, adv_registered
+    adv_registered = False
     print_info_dated_msg(f"Error: Failed to register advertisement {error}")
     mainloop.quit()
 
@@ -1266,21 +1657,26 @@ def handle_advertisement_interfaces_added(
     :param interfaces: The DBus interfaces for the found device.
     :return: Nothing
     """
-    if bluetooth_constants.DEVICE_INTERFACE in interfaces:
-        properties = interfaces[bluetooth_constants.DEVICE_INTERFACE]
+    properties = interfaces.get(bluetooth_constants.DEVICE_INTERFACE)
+    if properties is None:
+        return
 
-        if "Connected" in properties:
+    update_device_info(path, properties)
 
-            print_info_dated_msg(
-                "Advertisement add", bluetooth_utils.dbus_to_python(path),
-                "connected:", properties["Connected"])
-
-            if properties["Connected"] and path not in devices_connected:
-                print_info_dated_msg("ADD: Added to connected...")
-                devices_connected[path] = properties
-            elif not properties["Connected"] and path in devices_connected:
-                print_info_dated_msg("ADD: Removed from connected...")
-                del devices_connected[path]
+    if "Connected" in properties:
+
+        logger.debug("Advertisement add %s connected: %s",
+                     path, properties["Connected"])
+
+        if properties["Connected"] and path not in devices_connected:
+            logger.debug("ADD: Added to connected...")
+            devices_connected[path] = properties
+
+            if is_connection_goal_reached():
+                advertising_finish()
+        elif not properties["Connected"] and path in devices_connected:
+            logger.debug("ADD: Removed from connected...")
+            del devices_connected[path]
 
 
 def handle_advertisement_properties_changed(
@@ -1296,30 +1692,29 @@ def handle_advertisement_properties_changed(
     :param path: The DBus ObjectPath to the device.
     :return: Nothing.
     """
-    global glob_connection_bus
-
     if interface == bluetooth_constants.DEVICE_INTERFACE:
-        print("Advertisement change", bluetooth_utils.dbus_to_python(path),
-              end=" ")
+        update_device_info(path, changed, invalidated)
 
         if "Connected" in changed:
 
-            print("connected:", changed["Connected"])
+            logger.debug("Advertisement change %s connected: %s",
+                         path, changed["Connected"])
 
             if changed["Connected"] and path not in devices_connected:
-                print_info_dated_msg("UPD: Added to connected...")
-                device_properties = \
-                    get_device_properties_interface(glob_connection_bus, path)
-                devices_connected[path] = \
-                    device_properties.GetAll(
-                        bluetooth_constants.DEVICE_INTERFACE)
+                logger.debug("UPD: Added to connected...")
+                # Further properties are read from the device info, when
+                # needed
+                devices_connected[path] = devices_info[path]
+
+                if is_connection_goal_reached():
+                    advertising_finish()
 
             elif not changed["Connected"] and path in devices_connected:
-                print_info_dated_msg("UPD: Removed from connected...")
+                logger.debug("UPD: Removed from connected...")
                 del devices_connected[path]
 
         else:
-            print("...")
+            logger.debug("Advertisement change %s ...", path)
 
 
 def handle_connection_monitor_interfaces_added(
@@ -1331,38 +1726,45 @@ def handle_connection_monitor_interfaces_added(
     :param interfaces: The DBus interfaces for the found device.
     :return: Nothing
     """
-    global mutex_role_to_device
-
-    if bluetooth_constants.DEVICE_INTERFACE in interfaces:
-        properties = interfaces[bluetooth_constants.DEVICE_INTERFACE]
+    properties = interfaces.get(bluetooth_constants.DEVICE_INTERFACE)
+    if properties is None:
+        return
 
-        if "Connected" in properties:
-            mutex_role_to_device.acquire()
-            if properties["Connected"] and path not in devices_connected:
-                devices_connected[path] = properties
+    update_device_info(path, properties)
 
-                if path not in role_to_device or \
-                        role_to_device[path] == NodeModes.NONE:
-                    print_info_dated_msg("Device initiated connection:",
-                                         bluetooth_utils.dbus_to_python(path))
-                    role_to_device[path] = NodeModes.PERIPHERAL
-                elif role_to_device[path] == NodeModes.CENTRAL:
-                    print_info_dated_msg("Already connected as central!")
+    if "Connected" in properties:
+        if properties["Connected"] and path not in devices_connected:
+            devices_connected[path] = properties
 
-            elif not properties["Connected"] and path in devices_connected:
-                del devices_connected[path]
-                print_info_dated_msg("Device disconnected:",
+            if path not in role_to_device or \
+                    role_to_device[path] == NodeModes.NONE:
+                print_info_dated_msg("Device initiated connection:",
                                      bluetooth_utils.dbus_to_python(path))
-                role_to_device[path] = NodeModes.NONE
+                role_to_device[path] = NodeModes.PERIPHERAL
+            elif role_to_device[path] == NodeModes.CENTRAL:
+                print_info_dated_msg("Already connected as central!")
+
+        elif not properties["Connected"] and path in devices_connected:
+            del devices_connected[path]
+            print_info_dated_msg("Device disconnected:",
+                                 bluetooth_utils.dbus_to_python(path))
+            role_to_device[path] = NodeModes.NONE
 
-            mutex_role_to_device.release()
+        # Devices connecting to this node can also reach the goal
+        discover_and_advertise_check_goal()
+
+        # No need to wait for the next check when all devices are gone
+        if current_step in STEPS_CONNECTION and \
+                len(devices_connected) == 0:
+            check_connected_devices()
 
 
 def handle_connection_monitor_properties_changed(
         interface: str, changed: Dict[str, any], invalidated: dbus.Array,
         path: str) -> None:
     """Handler for when BlueZ have updated the info for an existing device.
-    Will update connected devices accordingly.
+    Will update connected devices accordingly, once the connection state has
+    settled.
 
     :param interface: The DBus interface for the changed device.
     :param changed: The DBus properties dict with changed properties for the
@@ -1371,35 +1773,65 @@ def handle_connection_monitor_properties_changed(
     :param path: The DBus ObjectPath to the device.
     :return: Nothing.
     """
-    global glob_connection_bus, mutex_role_to_device
+    global devices_connection_timer_ids
 
     if interface == bluetooth_constants.DEVICE_INTERFACE:
+        update_device_info(path, changed, invalidated)
+
         if "Connected" in changed:
-            mutex_role_to_device.acquire()
-            if changed["Connected"] and path not in devices_connected:
-                device_properties = \
-                    get_device_properties_interface(glob_connection_bus, path)
-                devices_connected[path] = \
-                    device_properties.GetAll(
-                        bluetooth_constants.DEVICE_INTERFACE)
-
-                if path not in role_to_device or \
-                        role_to_device[path] == NodeModes.NONE:
-                    print_info_dated_msg(
-                        "Device initiated connection:",
-                        bluetooth_utils.dbus_to_python(path))
-                    role_to_device[path] = NodeModes.PERIPHERAL
-
-                elif role_to_device[path] == NodeModes.CENTRAL:
-                    print_info_dated_msg("Already connected as central!")
+            # Restarted on every change, only the settled state is handled
+            timer_id_connection = devices_connection_timer_ids.pop(path, None)
+            if timer_id_connection is not None:
+                GLib.source_remove(timer_id_connection)
 
-            elif not changed["Connected"] and path in devices_connected:
-                del devices_connected[path]
-                print_info_dated_msg("Device disconnected:",
-                                     bluetooth_utils.dbus_to_python(path))
-                role_to_device[path] = NodeModes.NONE
+            devices_connection_timer_ids[path] = GLib.timeout_add(
+                CONNECTION_SETTLE_INTERVAL,
+                handle_connection_settled_timeout, path)
+
+
+def handle_connection_settled_timeout(path: str) -> bool:
+    """Handler for when the connection state of a device has settled. Will
+    update connected devices accordingly.
+
+    :param path: The DBus ObjectPath to the device.
+    :return: False, to only run the timeout once.
+    """
+    global devices_connection_timer_ids
 
-            mutex_role_to_device.release()
+    devices_connection_timer_ids.pop(path, None)
+
+    # Kept up to date by the "PropertiesChanged" signal
+    connected = devices_info.get(path, {}).get("Connected", False)
+
+    if connected and path not in devices_connected:
+        # Further properties are read from the device info, when needed
+        devices_connected[path] = devices_info[path]
+
+        if path not in role_to_device or \
+                role_to_device[path] == NodeModes.NONE:
+            print_info_dated_msg(
+                "Device initiated connection:",
+                bluetooth_utils.dbus_to_python(path))
+            role_to_device[path] = NodeModes.PERIPHERAL
+
+        elif role_to_device[path] == NodeModes.CENTRAL:
+            print_info_dated_msg("Already connected as central!")
+
+    elif not connected and path in devices_connected:
+        del devices_connected[path]
+        print_info_dated_msg("Device disconnected:",
+                             bluetooth_utils.dbus_to_python(path))
+        role_to_device[path] = NodeModes.NONE
+
+    # Devices connecting to this node can also reach the goal
+    discover_and_advertise_check_goal()
+
+    # No need to wait for the next check when all devices are gone
+    if current_step in STEPS_CONNECTION and \
+            len(devices_connected) == 0:
+        check_connected_devices()
+
+    return False
 
 
 # ------ [ Main Program ] -----------------------------------------------------
@@ -1409,9 +1841,8 @@ def handle_connection_monitor_properties_changed(
 
 
 def run_device_discovery(bus: BusConnection, scan_time: int = 0) -> None:
-    """Begin device discovery by starting thread to look for seen devices and
-    then start the scan process. Scan for specified amount of time or
-    60 seconds.
+    """Begin device discovery by starting the scan process, which also looks
+    for seen devices. Scan for specified amount of time or 60 seconds.
 
     :param bus: The DBus BusConnection used for communications.
     :param scan_time: How long to scan for in seconds.
@@ -1427,10 +1858,7 @@ def run_device_discovery(bus: BusConnection, scan_time: int = 0) -> None:
     print("Scan for", scan_time, "seconds..")
 
     # Scanning
-    thread = Thread(target=thread_check_seen_devices, args=(bus,))
-    thread.start()
     discovery_start(bus, scan_time * 1000)
-    thread.join()
 
 
 def run_device_advertisement(bus: BusConnection, adv_time: int = 0) -> None:
@@ -1467,6 +1895,9 @@ def run_connection_monitor_mode_auto_node(bus: BusConnection) -> None:
         # Discover and advertise
         discover_and_advertise_start(bus, 60)
 
+        if current_step == ProgramStates.STEP_KILL_PROGRAM:
+            return
+
         if len(devices_connected) == 0:
             print_info_dated_msg(
                 "Found no devices to connect to. Trying again.")
@@ -1492,6 +1923,9 @@ def run_connection_monitor_mode_central_node(bus: BusConnection) -> None:
         # Scan for peripherals for 30 seconds
         run_device_discovery(bus, 30)
 
+        if current_step == ProgramStates.STEP_KILL_PROGRAM:
+            return
+
         # Get matching devices
         matching_devices = get_matching_and_active_devices()
 
@@ -1523,6 +1957,9 @@ def run_connection_monitor_mode_peripheral_node(bus: BusConnection) -> None:
         # Advertise for 30 seconds
         run_device_advertisement(bus, 30)
 
+        if current_step == ProgramStates.STEP_KILL_PROGRAM:
+            return
+
         if len(devices_connected) == 0:
             print_info_dated_msg(
                 "Found no devices to connect to. Trying again.")
@@ -1543,8 +1980,16 @@ if __name__ == '__main__':
     parser.add_argument("-n", "--node", help="Node mode", nargs='?',
                         choices=['auto', 'central', 'peripheral'],
                         const="auto", default="auto", type=str)
+    parser.add_argument("-v", "--verbose", help="Print debug messages",
+                        action="store_true")
     args = parser.parse_args()
 
+    # Logging
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG,
+                            format="%(asctime)s - %(message)s",
+                            datefmt="%Y-%m-%d %H:%M:%S")
+
     # Bus setup
     bus_connection = initialize_dbus()
 
@@ -1586,4 +2031,7 @@ if __name__ == '__main__':
             print("Node mode: Peripheral")
             # TODO: Implement
 
+    adapter_discovery_stop()
+    bus_connection.close()
+
     print("Done with program!")